@@ -1,802 +1,1637 @@
-import os
-import time
-import logging
-import tempfile
-import re
-from datetime import datetime, timedelta
-from pathlib import Path
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
-import pdfplumber
-import pandas as pd
-
-# === CONFIGURATION ===
-OUTPUT_FOLDER = r"C:\Users\Dell\OneDrive\Desktop\gauhatistate_hc\gauhati_causelists"
-LOG_FILE = os.path.join(OUTPUT_FOLDER, "gauhati_download_log.txt")
-EXCEL_FILE = os.path.join(OUTPUT_FOLDER, "gauhati_causelists_data.xlsx")
-CAUSELIST_URL = "https://hcservices.ecourts.gov.in/ecourtindiaHC/cases/highcourt_causelist.php?state_cd=6&dist_cd=1&court_code=1&stateNm=Assam"
-
-# Date range configuration
-START_DATE = datetime(2025, 9, 1)
-END_DATE = datetime(2025, 10, 30)
-
-# === LOGGING SETUP ===
-os.makedirs(OUTPUT_FOLDER, exist_ok=True)
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(LOG_FILE, encoding='utf-8'),
-        logging.StreamHandler()
-    ]
-)
-
-# === CHROME DRIVER SETUP ===
-def setup_driver():
-    """Configure Chrome driver with download preferences."""
-    chrome_options = Options()
-    chrome_options.add_argument("--start-maximized")
-    chrome_options.add_argument("--disable-notifications")
-    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    
-    temp_dir = tempfile.mkdtemp()
-    chrome_options.add_argument(f"--user-data-dir={temp_dir}")
-    
-    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-    chrome_options.add_experimental_option('useAutomationExtension', False)
-    
-    prefs = {
-        "download.default_directory": OUTPUT_FOLDER,
-        "download.prompt_for_download": False,
-        "plugins.always_open_pdf_externally": True,
-        "plugins.plugins_disabled": ["Chrome PDF Viewer"],
-        "download.directory_upgrade": True,
-        "safebrowsing.enabled": True
-    }
-    chrome_options.add_experimental_option("prefs", prefs)
-    
-    driver = webdriver.Chrome(
-        service=Service(ChromeDriverManager().install()),
-        options=chrome_options
-    )
-    return driver
-
-
-def wait_for_download(download_folder, timeout=60):
-    """Wait for download to complete."""
-    seconds = 0
-    while seconds < timeout:
-        time.sleep(1)
-        files = os.listdir(download_folder)
-        if not any(f.endswith('.crdownload') or f.endswith('.tmp') for f in files):
-            time.sleep(2)
-            return True
-        seconds += 1
-    logging.warning(f"Download timeout after {timeout} seconds")
-    return False
-
-
-def get_latest_pdf(folder):
-    """Get the most recently downloaded PDF."""
-    pdf_files = [f for f in os.listdir(folder) if f.lower().endswith('.pdf')]
-    if not pdf_files:
-        return None
-    pdf_files.sort(key=lambda x: os.path.getmtime(os.path.join(folder, x)), reverse=True)
-    return pdf_files[0]
-
-
-# === DATE PICKER INTERACTION ===
-def select_date_in_picker(driver, target_date):
-    """Select a specific date in the date picker."""
-    try:
-        wait = WebDriverWait(driver, 15)
-        date_str = target_date.strftime("%d-%m-%Y")
-        
-        selectors = [
-            (By.ID, "date_in_01"),
-            (By.NAME, "date_in_01"),
-            (By.XPATH, "//input[@type='text' and contains(@placeholder, 'date')]"),
-            (By.XPATH, "//input[@type='text' and @id='date_in_01']"),
-            (By.XPATH, "//input[contains(@class, 'date')]"),
-            (By.CSS_SELECTOR, "input[type='text'][id='date_in_01']")
-        ]
-        
-        date_input = None
-        for by_type, selector in selectors:
-            try:
-                date_input = wait.until(EC.element_to_be_clickable((by_type, selector)))
-                logging.info(f"Found date input using: {by_type} = {selector}")
-                break
-            except:
-                continue
-        
-        if not date_input:
-            logging.error("Could not find date input field with any selector")
-            return False
-        
-        date_input.click()
-        time.sleep(0.5)
-        date_input.clear()
-        time.sleep(0.5)
-        
-        driver.execute_script("arguments[0].value = arguments[1];", date_input, date_str)
-        time.sleep(0.5)
-        date_input.send_keys(date_str)
-        driver.execute_script("arguments[0].dispatchEvent(new Event('change'));", date_input)
-        
-        logging.info(f"✅ Selected date: {date_str}")
-        time.sleep(1)
-        return True
-        
-    except Exception as e:
-        logging.error(f"Error selecting date: {e}")
-        try:
-            screenshot_path = os.path.join(OUTPUT_FOLDER, f"error_date_picker_{int(time.time())}.png")
-            driver.save_screenshot(screenshot_path)
-            logging.info(f"Screenshot saved: {screenshot_path}")
-        except:
-            pass
-        return False
-
-
-def click_go_button(driver):
-    """Click the GO button to load cause lists."""
-    try:
-        wait = WebDriverWait(driver, 10)
-        
-        selectors = [
-            (By.XPATH, "//input[@value='GO']"),
-            (By.XPATH, "//input[@value='Go']"),
-            (By.XPATH, "//button[contains(text(), 'GO')]"),
-            (By.XPATH, "//input[@type='submit' and contains(@value, 'GO')]"),
-            (By.CSS_SELECTOR, "input[value='GO']")
-        ]
-        
-        go_button = None
-        for by_type, selector in selectors:
-            try:
-                go_button = wait.until(EC.element_to_be_clickable((by_type, selector)))
-                logging.info(f"Found GO button using: {by_type} = {selector}")
-                break
-            except:
-                continue
-        
-        if not go_button:
-            logging.error("Could not find GO button with any selector")
-            return False
-        
-        go_button.click()
-        logging.info("✅ Clicked GO button")
-        time.sleep(3)
-        return True
-        
-    except Exception as e:
-        logging.error(f"Error clicking GO button: {e}")
-        return False
-
-
-# === CAUSELIST TABLE PROCESSING ===
-def get_causelist_table_rows(driver):
-    """Extract all rows from the causelist table."""
-    try:
-        wait = WebDriverWait(driver, 10)
-        
-        table = wait.until(
-            EC.presence_of_element_located((By.XPATH, "//table[contains(@class, 'table') or .//th[contains(text(), 'Bench')] or .//th[contains(text(), 'Sr No')]]"))
-        )
-        
-        try:
-            tbody = table.find_element(By.TAG_NAME, "tbody")
-            rows = tbody.find_elements(By.TAG_NAME, "tr")
-        except:
-            all_rows = table.find_elements(By.TAG_NAME, "tr")
-            rows = all_rows[1:] if len(all_rows) > 1 else all_rows
-        
-        logging.info(f"Found {len(rows)} causelist entries in table")
-        
-        # Extract bench names for each row
-        causelist_data = []
-        for idx, row in enumerate(rows, start=1):
-            cells = row.find_elements(By.TAG_NAME, "td")
-            if len(cells) >= 3:
-                sr_no = cells[0].text.strip()
-                bench_name = cells[1].text.strip() if len(cells) > 1 else "N/A"
-                causelist_type = cells[2].text.strip() if len(cells) > 2 else "N/A"
-                
-                causelist_data.append({
-                    'sr_no': sr_no,
-                    'bench_name': bench_name,
-                    'causelist_type': causelist_type,
-                    'row': row
-                })
-        
-        return causelist_data
-        
-    except TimeoutException:
-        logging.warning("No causelist table found for this date")
-        return []
-    except Exception as e:
-        logging.error(f"Error getting table rows: {e}")
-        return []
-
-
-def download_causelist_pdf(driver, row_data, current_date):
-    """Download PDF for a specific causelist row."""
-    try:
-        row = row_data['row']
-        sr_no = row_data['sr_no']
-        bench_name = row_data['bench_name']
-        
-        cells = row.find_elements(By.TAG_NAME, "td")
-        
-        if len(cells) < 3:
-            logging.warning(f"  Sr No {sr_no}: Row has insufficient columns ({len(cells)})")
-            return None, bench_name
-        
-        sr_no_text = cells[0].text.strip()
-        bench_text = cells[1].text.strip() if len(cells) > 1 else "Unknown"
-        causelist_type = cells[2].text.strip() if len(cells) > 2 else "Unknown"
-        
-        logging.info(f"  Sr No {sr_no_text}: Bench - {bench_text}, Type - {causelist_type}")
-        
-        view_link = None
-        try:
-            view_link = cells[-1].find_element(By.LINK_TEXT, "View")
-        except:
-            try:
-                view_link = cells[-1].find_element(By.PARTIAL_LINK_TEXT, "View")
-            except:
-                try:
-                    view_link = cells[-1].find_element(By.TAG_NAME, "a")
-                except:
-                    logging.warning(f"    ⚠️ Could not find View link for Sr No {sr_no_text}")
-                    return None, bench_name
-        
-        if not view_link:
-            logging.warning(f"    ⚠️ No View link found for Sr No {sr_no_text}")
-            return None, bench_name
-        
-        main_window = driver.current_window_handle
-        view_link.click()
-        time.sleep(3)
-        
-        if len(driver.window_handles) > 1:
-            driver.switch_to.window(driver.window_handles[-1])
-            time.sleep(2)
-            
-            try:
-                download_selectors = [
-                    (By.XPATH, "//button[contains(@title, 'Download')]"),
-                    (By.XPATH, "//button[contains(@class, 'download')]"),
-                    (By.XPATH, "//a[contains(@title, 'Download')]"),
-                    (By.XPATH, "//button[contains(text(), 'Download')]"),
-                    (By.ID, "download"),
-                    (By.CSS_SELECTOR, "button[title*='Download']")
-                ]
-                
-                download_btn = None
-                for by_type, selector in download_selectors:
-                    try:
-                        download_btn = WebDriverWait(driver, 5).until(
-                            EC.element_to_be_clickable((by_type, selector))
-                        )
-                        break
-                    except:
-                        continue
-                
-                if download_btn:
-                    download_btn.click()
-                    logging.info(f"    ✅ Clicked download button for Sr No {sr_no_text}")
-                else:
-                    logging.info(f"    📄 PDF opened (auto-download expected) for Sr No {sr_no_text}")
-                
-            except TimeoutException:
-                logging.info(f"    📄 PDF auto-downloading for Sr No {sr_no_text}")
-            
-            if wait_for_download(OUTPUT_FOLDER, timeout=40):
-                latest_pdf = get_latest_pdf(OUTPUT_FOLDER)
-                if latest_pdf:
-                    date_str = current_date.strftime("%d-%m-%Y")
-                    new_name = f"causelist_{date_str}_{sr_no_text}.pdf"
-                    
-                    old_path = os.path.join(OUTPUT_FOLDER, latest_pdf)
-                    new_path = os.path.join(OUTPUT_FOLDER, new_name)
-                    
-                    if os.path.exists(new_path):
-                        logging.info(f"    ⚠️ PDF already exists: {new_name}")
-                        try:
-                            os.remove(old_path)
-                        except:
-                            pass
-                    else:
-                        try:
-                            os.rename(old_path, new_path)
-                            logging.info(f"    ✅ Downloaded: {new_name}")
-                        except Exception as e:
-                            logging.error(f"    ❌ Error renaming file: {e}")
-                            new_name = latest_pdf
-                    
-                    driver.close()
-                    driver.switch_to.window(main_window)
-                    time.sleep(1)
-                    return new_name, bench_name
-            
-            driver.close()
-            driver.switch_to.window(main_window)
-            time.sleep(1)
-        else:
-            if wait_for_download(OUTPUT_FOLDER, timeout=30):
-                latest_pdf = get_latest_pdf(OUTPUT_FOLDER)
-                if latest_pdf:
-                    date_str = current_date.strftime("%d-%m-%Y")
-                    new_name = f"causelist_{date_str}_{sr_no_text}.pdf"
-                    
-                    old_path = os.path.join(OUTPUT_FOLDER, latest_pdf)
-                    new_path = os.path.join(OUTPUT_FOLDER, new_name)
-                    
-                    if not os.path.exists(new_path):
-                        os.rename(old_path, new_path)
-                        logging.info(f"    ✅ Downloaded: {new_name}")
-                        return new_name, bench_name
-        
-        return None, bench_name
-        
-    except Exception as e:
-        logging.error(f"    ❌ Error downloading Sr No {sr_no}: {e}")
-        try:
-            if len(driver.window_handles) > 1:
-                driver.close()
-            driver.switch_to.window(driver.window_handles[0])
-        except:
-            pass
-        return None, bench_name
-
-
-# === PDF EXTRACTION FUNCTIONS ===
-def extract_header_info(pdf_text):
-    """Extract court hall number and time from PDF header."""
-    court_no = "N/A"
-    time_info = "N/A"
-    
-    try:
-        # Extract court number
-        court_pattern = r'COURT\s*NO\s*:?\s*(\d+)'
-        court_match = re.search(court_pattern, pdf_text, re.IGNORECASE)
-        if court_match:
-            court_no = court_match.group(1)
-        
-        # Extract time
-        time_pattern = r'(\d{1,2}:\d{2}\s*[AP]M\s*to\s*\d{1,2}:\d{2}\s*[AP]M)'
-        time_match = re.search(time_pattern, pdf_text, re.IGNORECASE)
-        if time_match:
-            time_info = time_match.group(1)
-        
-        # Check for multiple time slots
-        time_pattern_multi = r'(\d{1,2}:\d{2}\s*[AP]M\s*to\s*\d{1,2}:\d{2}\s*[AP]M)\s*(\d{1,2}:\d{2}\s*[AP]M\s*to\s*\d{1,2}:\d{2}\s*[AP]M)'
-        time_match_multi = re.search(time_pattern_multi, pdf_text, re.IGNORECASE)
-        if time_match_multi:
-            time_info = f"{time_match_multi.group(1)} {time_match_multi.group(2)}"
-            
-    except Exception as e:
-        logging.error(f"Error extracting header info: {e}")
-    
-    return court_no, time_info
-
-
-def extract_date_from_filename(filename):
-    """Extract date from filename format: causelist_DD-MM-YYYY_X.pdf"""
-    try:
-        date_pattern = r'causelist_(\d{2}-\d{2}-\d{4})_\d+\.pdf'
-        match = re.search(date_pattern, filename)
-        if match:
-            return match.group(1)
-        return "N/A"
-    except:
-        return "N/A"
-
-
-def parse_gauhati_causelist(pdf_path, bench_name_from_table):
-    """Parse Gauhati High Court causelist PDF using positional text parsing."""
-    cases = []
-    
-    try:
-        pdf_filename = os.path.basename(pdf_path)
-        logging.info(f"\n{'='*60}")
-        logging.info(f"📄 Extracting: {pdf_filename}")
-        logging.info(f"{'='*60}")
-        
-        # Extract date from filename
-        cause_date = extract_date_from_filename(pdf_filename)
-        
-        # Extract text using pdfplumber with layout preservation
-        all_text = ""
-        
-        with pdfplumber.open(pdf_path) as pdf:
-            for page_num, page in enumerate(pdf.pages, 1):
-                # Use extract_text with layout=True to preserve column positions
-                page_text = page.extract_text(layout=True)
-                if page_text:
-                    all_text += page_text + "\n"
-        
-        if not all_text:
-            logging.warning(f"No text extracted from {pdf_filename}")
-            return cases
-        
-        # Extract header information
-        court_no, time_info = extract_header_info(all_text)
-        bench_name = bench_name_from_table if bench_name_from_table != "N/A" else "N/A"
-        
-        logging.info(f"Court No: {court_no}")
-        logging.info(f"Time: {time_info}")
-        logging.info(f"Bench: {bench_name}")
-        logging.info(f"Date: {cause_date}")
-        
-        # Split text into lines
-        lines = all_text.split('\n')
-        
-        # Find the header line with column positions
-        header_idx = -1
-        header_positions = {}
-        
-        for i, line in enumerate(lines):
-            if 'Sr.No' in line and 'Case Number' in line and 'Main Parties' in line:
-                header_idx = i
-                logging.info(f"Found header at line {i}")
-                
-                # Find column positions
-                if 'Sr.No' in line:
-                    header_positions['sr_no'] = line.find('Sr.No')
-                if 'Case Number' in line:
-                    header_positions['case_number'] = line.find('Case Number')
-                if 'Main Parties' in line:
-                    header_positions['main_parties'] = line.find('Main Parties')
-                if 'Petitioner Advocate' in line:
-                    header_positions['pet_advocate'] = line.find('Petitioner Advocate')
-                if 'Respondent Advocate' in line:
-                    header_positions['resp_advocate'] = line.find('Respondent Advocate')
-                
-                logging.info(f"Column positions: {header_positions}")
-                break
-        
-        if header_idx == -1:
-            logging.warning(f"No header found in {pdf_filename}")
-            return cases
-        
-        # Start parsing from the line after header and separator
-        i = header_idx + 1
-        
-        # Skip separator lines (dashes)
-        while i < len(lines) and '---' in lines[i]:
-            i += 1
-        
-        logging.info(f"Starting case extraction from line {i}")
-        
-        # Parse cases
-        case_count = 0
-        while i < len(lines):
-            line = lines[i]
-            
-            # Check if line starts with a number (Sr.No) at the beginning
-            stripped = line.lstrip()
-            sr_match = re.match(r'^(\d+)\s', stripped)
-            
-            if sr_match:
-                case_count += 1
-                sr_no = sr_match.group(1)
-                
-                logging.info(f"\n--- Case {case_count}: Sr.No {sr_no} ---")
-                logging.info(f"Line {i}: {line[:100]}")
-                
-                # Collect all lines for this case until next Sr.No or section break
-                case_lines = [line]
-                j = i + 1
-                
-                while j < len(lines):
-                    next_line = lines[j]
-                    next_stripped = next_line.lstrip()
-                    
-                    # Stop if we hit next case number
-                    if re.match(r'^\d+\s', next_stripped):
-                        break
-                    
-                    # Stop if we hit a major section break
-                    if '===' in next_line or 'LEAVE NOTE' in next_line:
-                        break
-                    
-                    # Skip pure separator lines
-                    if next_line.strip() and not next_line.strip().replace('-', '').strip():
-                        j += 1
-                        continue
-                    
-                    if next_line.strip():
-                        case_lines.append(next_line)
-                    
-                    j += 1
-                
-                # Join all case lines
-                full_case_text = '\n'.join(case_lines)
-                
-                # Extract case number from first line
-                case_pattern = r'([A-Z]+(?:\([A-Z]\))?(?:\.[A-Z]+)?(?:\([A-Za-z]+\))?)/(\d+)/(\d{4})'
-                case_match = re.search(case_pattern, full_case_text)
-                
-                case_type = "N/A"
-                case_number = "N/A"
-                case_year = "N/A"
-                
-                if case_match:
-                    case_type = case_match.group(1)
-                    case_number = case_match.group(2)
-                    case_year = case_match.group(3)
-                    logging.info(f"Case: {case_type}/{case_number}/{case_year}")
-                else:
-                    # Alternative pattern for complex types
-                    alt_pattern = r'([A-Z\.\(\)]+)/(\d+)/(\d{4})'
-                    alt_match = re.search(alt_pattern, full_case_text)
-                    if alt_match:
-                        case_type = alt_match.group(1)
-                        case_number = alt_match.group(2)
-                        case_year = alt_match.group(3)
-                        logging.info(f"Case (alt): {case_type}/{case_number}/{case_year}")
-                
-                # Extract parties by splitting on "Versus"
-                petitioner = "N/A"
-                respondent = "N/A"
-                petitioner_advocate = "N/A"
-                respondent_advocate = "N/A"
-                
-                if 'Versus' in full_case_text:
-                    # Split the entire text by Versus
-                    parts = full_case_text.split('Versus', 1)
-                    
-                    # Part 1: Contains Sr.No, Case Number, and Petitioner
-                    before_versus = parts[0]
-                    
-                    # Part 2: Contains Respondent and Advocates
-                    after_versus = parts[1] if len(parts) > 1 else ""
-                    
-                    # Extract petitioner - remove sr no and case number
-                    pet_text = before_versus
-                    pet_text = re.sub(r'^\d+\s+', '', pet_text)  # Remove sr no
-                    if case_match:
-                        pet_text = pet_text.replace(case_match.group(0), '')  # Remove case number
-                    
-                    # Clean up petitioner
-                    pet_lines = [l.strip() for l in pet_text.split('\n') if l.strip()]
-                    # Filter out any WITH or other keywords
-                    pet_lines = [l for l in pet_lines if not l.startswith('WITH') and not l.startswith('in ')]
-                    petitioner = ' '.join(pet_lines).strip()
-                    
-                    # Process after_versus section
-                    after_lines = [l.strip() for l in after_versus.split('\n') if l.strip()]
-                    
-                    # Separate respondent from advocates
-                    resp_lines = []
-                    pet_adv_lines = []
-                    resp_adv_lines = []
-                    
-                    found_advocate = False
-                    
-                    for line_text in after_lines:
-                        # Check if this line contains advocate keywords
-                        has_advocate = any(kw in line_text.upper() for kw in ['MR.', 'MRS.', 'MS.', 'DR.', 'ADVOCATE', 'SC,', 'GA,', 'PP,'])
-                        
-                        if not found_advocate and not has_advocate:
-                            # This is respondent
-                            resp_lines.append(line_text)
-                        elif has_advocate:
-                            found_advocate = True
-                            # This is advocate line
-                            # Respondent advocates have (R- or (r- pattern
-                            if '(R-' in line_text or '(r-' in line_text or '(R1' in line_text or '(R2' in line_text:
-                                resp_adv_lines.append(line_text)
-                            else:
-                                # Petitioner advocate (no R- marker)
-                                pet_adv_lines.append(line_text)
-                    
-                    respondent = ' '.join(resp_lines).strip() if resp_lines else "N/A"
-                    petitioner_advocate = ' '.join(pet_adv_lines).strip() if pet_adv_lines else "N/A"
-                    respondent_advocate = ' '.join(resp_adv_lines).strip() if resp_adv_lines else "N/A"
-                    
-                else:
-                    # No Versus found - might be a WITH clause or other format
-                    petitioner = full_case_text
-                    if case_match:
-                        petitioner = petitioner.replace(case_match.group(0), '').strip()
-                    petitioner = re.sub(r'^\d+\s+', '', petitioner).strip()
-                
-                logging.info(f"Petitioner: {petitioner[:70]}")
-                logging.info(f"Respondent: {respondent[:70]}")
-                logging.info(f"Pet Advocate: {petitioner_advocate[:70]}")
-                logging.info(f"Resp Advocate: {respondent_advocate[:70]}")
-                
-                # Create case entry
-                case_data = {
-                    "id": None,
-                    "causelist_slno": sr_no,
-                    "court_hall_number": court_no,
-                    "Case_number": case_number,
-                    "Case_type": case_type,
-                    "case_year": case_year,
-                    "bench_name": bench_name,
-                    "cause_date": cause_date,
-                    "time": time_info,
-                    "petitioner": petitioner,
-                    "respondent": respondent,
-                    "petitioner_advocate": petitioner_advocate,
-                    "respondent_advocate": respondent_advocate,
-                    "particulars": "List Downloaded",
-                    "Pdf_name": pdf_filename,
-                    "case_status": "N/A"
-                }
-                
-                cases.append(case_data)
-                
-                # Move to next case
-                i = j
-            else:
-                i += 1
-        
-        logging.info(f"\n{'='*60}")
-        logging.info(f"✅ Extracted {len(cases)} cases from {pdf_filename}")
-        logging.info(f"{'='*60}\n")
-        
-    except Exception as e:
-        logging.error(f"❌ Error processing {pdf_path}: {e}", exc_info=True)
-    
-    return cases
-
-
-def save_to_excel(cases_data, excel_path):
-    """Save or append case data to Excel file."""
-    try:
-        if not cases_data:
-            logging.warning("No case data to save")
-            return False
-        
-        columns = [
-            "id", "causelist_slno", "court_hall_number", "Case_number", "Case_type",
-            "case_year", "bench_name", "cause_date", "time",
-            "petitioner", "respondent", "petitioner_advocate", "respondent_advocate",
-            "particulars", "Pdf_name", "case_status"
-        ]
-        
-        df_new = pd.DataFrame(cases_data)
-        
-        for col in columns:
-            if col not in df_new.columns:
-                df_new[col] = "N/A"
-        
-        df_new = df_new[columns]
-        
-        if os.path.exists(excel_path):
-            df_existing = pd.read_excel(excel_path)
-            df_combined = pd.concat([df_existing, df_new], ignore_index=True)
-            df_combined["id"] = range(1, len(df_combined) + 1)
-            df_combined.to_excel(excel_path, index=False)
-            logging.info(f"✅ Appended {len(df_new)} cases → Total: {len(df_combined)}")
-        else:
-            df_new["id"] = range(1, len(df_new) + 1)
-            df_new.to_excel(excel_path, index=False)
-            logging.info(f"✅ Created Excel file with {len(df_new)} cases")
-        
-        return True
-        
-    except Exception as e:
-        logging.error(f"Error saving to Excel: {e}")
-        return False
-
-
-# === MAIN EXECUTION ===
-def main():
-    logging.info("=" * 80)
-    logging.info("GAUHATI HIGH COURT CAUSELIST PDF DOWNLOADER & EXTRACTOR")
-    logging.info("=" * 80)
-    
-    driver = setup_driver()
-    total_pdfs_downloaded = 0
-    total_cases_extracted = 0
-    failed_downloads = []
-    
-    try:
-        driver.get(CAUSELIST_URL)
-        time.sleep(3)
-        logging.info(f"Opened URL: {CAUSELIST_URL}")
-        
-        current_date = START_DATE
-        
-        while current_date <= END_DATE:
-            logging.info("\n" + "=" * 80)
-            logging.info(f"PROCESSING DATE: {current_date.strftime('%d-%m-%Y')}")
-            logging.info("=" * 80)
-            
-            if not select_date_in_picker(driver, current_date):
-                logging.error(f"Failed to select date: {current_date}")
-                failed_downloads.append(f"{current_date.strftime('%d-%m-%Y')} - Date selection failed")
-                current_date += timedelta(days=1)
-                continue
-            
-            if not click_go_button(driver):
-                logging.error("Failed to click GO button")
-                failed_downloads.append(f"{current_date.strftime('%d-%m-%Y')} - GO button click failed")
-                current_date += timedelta(days=1)
-                continue
-            
-            # Get causelist rows with bench names
-            causelist_data = get_causelist_table_rows(driver)
-            
-            if not causelist_data:
-                logging.warning(f"No cause lists found for {current_date.strftime('%d-%m-%Y')}")
-                current_date += timedelta(days=1)
-                continue
-            
-            # Process each row
-            date_pdfs = 0
-            for row_data in causelist_data:
-                sr_no = row_data['sr_no']
-                bench_name = row_data['bench_name']
-                
-                pdf_filename, bench = download_causelist_pdf(driver, row_data, current_date)
-                
-                if pdf_filename:
-                    total_pdfs_downloaded += 1
-                    date_pdfs += 1
-                    
-                    # Extract data from PDF immediately
-                    pdf_path = os.path.join(OUTPUT_FOLDER, pdf_filename)
-                    if os.path.exists(pdf_path):
-                        cases = parse_gauhati_causelist(pdf_path, bench_name)
-                        
-                        if cases:
-                            if save_to_excel(cases, EXCEL_FILE):
-                                total_cases_extracted += len(cases)
-                        else:
-                            logging.warning(f"⚠️ No cases extracted from {pdf_filename}")
-                    else:
-                        logging.error(f"❌ PDF file not found: {pdf_path}")
-                else:
-                    failed_downloads.append(f"{current_date.strftime('%d-%m-%Y')} - Sr No {sr_no}")
-                
-                time.sleep(2)
-            
-            logging.info(f"Downloaded {date_pdfs} PDFs for {current_date.strftime('%d-%m-%Y')}")
-            
-            # Move to next date
-            current_date += timedelta(days=1)
-            time.sleep(3)
-        
-        # Final summary
-        logging.info("\n" + "=" * 80)
-        logging.info("PDF DOWNLOAD & EXTRACTION COMPLETED")
-        logging.info("=" * 80)
-        logging.info(f"Total PDFs Downloaded: {total_pdfs_downloaded}")
-        logging.info(f"Total Cases Extracted: {total_cases_extracted}")
-        logging.info(f"Failed Downloads: {len(failed_downloads)}")
-        
-        if failed_downloads:
-            logging.info("\nFailed Download Details:")
-            for fail in failed_downloads:
-                logging.info(f"  ❌ {fail}")
-        
-        logging.info(f"\nPDFs saved to: {OUTPUT_FOLDER}")
-        logging.info(f"Excel file saved to: {EXCEL_FILE}")
-        logging.info(f"Log file saved to: {LOG_FILE}")
-        
-    except Exception as e:
-        logging.error(f"Critical error in main execution: {e}", exc_info=True)
-        
-    finally:
-        driver.quit()
-        logging.info("\nBrowser closed. Process finished.")
-
-
-if __name__ == "__main__":
+import asyncio
+import csv
+import hashlib
+import os
+import sqlite3
+import time
+import logging
+import logging.handlers
+import multiprocessing
+import queue
+import tempfile
+import threading
+import re
+import zipfile
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from functools import lru_cache
+from pathlib import Path
+from urllib.parse import urljoin
+from xml.sax.saxutils import escape
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from webdriver_manager.chrome import ChromeDriverManager
+import pdfplumber
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+
+try:
+    import fitz  # PyMuPDF
+    PYMUPDF_AVAILABLE = True
+except ImportError:
+    PYMUPDF_AVAILABLE = False
+
+try:
+    import pypdfium2 as pdfium
+    PYPDFIUM_AVAILABLE = True
+except ImportError:
+    PYPDFIUM_AVAILABLE = False
+
+try:
+    import requests
+    REQUESTS_AVAILABLE = True
+except ImportError:
+    REQUESTS_AVAILABLE = False
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+# === CONFIGURATION ===
+OUTPUT_FOLDER = r"C:\Users\Dell\OneDrive\Desktop\gauhatistate_hc\gauhati_causelists"
+LOG_FILE = os.path.join(OUTPUT_FOLDER, "gauhati_download_log.txt")
+EXCEL_FILE = os.path.join(OUTPUT_FOLDER, "gauhati_causelists_data.xlsx")
+CSV_FILE = os.path.join(OUTPUT_FOLDER, "gauhati_causelists_data.csv")
+STATE_DB = os.path.join(OUTPUT_FOLDER, "parse_state.db")
+CAUSELIST_URL = "https://hcservices.ecourts.gov.in/ecourtindiaHC/cases/highcourt_causelist.php?state_cd=6&dist_cd=1&court_code=1&stateNm=Assam"
+CAUSELIST_QUERY_URL = "https://hcservices.ecourts.gov.in/ecourtindiaHC/cases/highcourt_causelist_qry.php"
+
+# Date range configuration
+START_DATE = datetime(2025, 9, 1)
+END_DATE = datetime(2025, 10, 30)
+
+# Number of parallel Chrome drivers for the per-date Selenium fallback
+MAX_DRIVERS = 4
+
+# Concurrent PDF downloads on the direct HTTP path
+HTTP_CONCURRENCY = 8
+
+# Retries per PDF when the server answers 429/503, with doubling backoff
+HTTP_RETRIES = 4
+
+# Parsed cases buffered before each Excel flush
+FLUSH_ROWS = 10000
+
+# Column order for the Excel output
+HEADERS = (
+    "id", "causelist_slno", "court_hall_number", "Case_number", "Case_type",
+    "case_year", "bench_name", "cause_date", "time",
+    "petitioner", "respondent", "petitioner_advocate", "respondent_advocate",
+    "particulars", "Pdf_name", "case_status"
+)
+
+# === PRECOMPILED REGEX PATTERNS ===
+# Compiled once at import so the per-line/per-case loops don't re-parse
+# the pattern strings on every call.
+RE_COURT = re.compile(r'COURT\s*NO\s*:?\s*(\d+)', re.IGNORECASE)
+RE_TIME = re.compile(r'(\d{1,2}:\d{2}\s*[AP]M\s*to\s*\d{1,2}:\d{2}\s*[AP]M)', re.IGNORECASE)
+RE_TIME_MULTI = re.compile(r'(\d{1,2}:\d{2}\s*[AP]M\s*to\s*\d{1,2}:\d{2}\s*[AP]M)\s*(\d{1,2}:\d{2}\s*[AP]M\s*to\s*\d{1,2}:\d{2}\s*[AP]M)', re.IGNORECASE)
+RE_CASE = re.compile(r'([A-Z]+(?:\([A-Z]\))?(?:\.[A-Z]+)?(?:\([A-Za-z]+\))?)/(\d+)/(\d{4})')
+RE_CASE_ALT = re.compile(r'([A-Z\.\(\)]+)/(\d+)/(\d{4})')
+RE_SRNO = re.compile(r'^(\d+)\s')
+RE_STRIP_SRNO = re.compile(r'^\d+\s+')
+RE_DATE_FN = re.compile(r'causelist_(\d{2}-\d{2}-\d{4})_\d+\.pdf')
+RE_ADVOCATE = re.compile(r'(?i)(?:\bMR\.|\bMRS\.|\bMS\.|\bDR\.|ADVOCATE|SC,|GA,|PP,)')
+RE_R_MARKER = re.compile(r'\((?:R-|r-|R1|R2)')
+RE_HTML_TR = re.compile(r'<tr[^>]*>(.*?)</tr>', re.IGNORECASE | re.DOTALL)
+RE_HTML_TD = re.compile(r'<td[^>]*>(.*?)</td>', re.IGNORECASE | re.DOTALL)
+RE_HREF = re.compile(r'href=["\']([^"\']+)["\']', re.IGNORECASE)
+RE_HTML_TAG = re.compile(r'<[^>]+>')
+
+# === PRECOMPUTED SELECTOR CHAINS ===
+# Built once at import instead of rebuilding the same lists on every call.
+# The page can contain more than one table; every row lookup must anchor
+# to the causelist table this XPath identifies, or a row index counted in
+# one table can resolve against another.
+CAUSELIST_TABLE_XPATH = (
+    "//table[contains(@class, 'table') or .//th[contains(text(), 'Bench')]"
+    " or .//th[contains(text(), 'Sr No')]]"
+)
+DATE_INPUT_SELECTORS = (
+    (By.ID, "date_in_01"),
+    (By.NAME, "date_in_01"),
+    (By.XPATH, "//input[@type='text' and contains(@placeholder, 'date')]"),
+    (By.XPATH, "//input[@type='text' and @id='date_in_01']"),
+    (By.XPATH, "//input[contains(@class, 'date')]"),
+    (By.CSS_SELECTOR, "input[type='text'][id='date_in_01']")
+)
+GO_BUTTON_SELECTORS = (
+    (By.XPATH, "//input[@value='GO']"),
+    (By.XPATH, "//input[@value='Go']"),
+    (By.XPATH, "//button[contains(text(), 'GO')]"),
+    (By.XPATH, "//input[@type='submit' and contains(@value, 'GO')]"),
+    (By.CSS_SELECTOR, "input[value='GO']")
+)
+DOWNLOAD_BUTTON_SELECTORS = (
+    (By.XPATH, "//button[contains(@title, 'Download')]"),
+    (By.XPATH, "//button[contains(@class, 'download')]"),
+    (By.XPATH, "//a[contains(@title, 'Download')]"),
+    (By.XPATH, "//button[contains(text(), 'Download')]"),
+    (By.ID, "download"),
+    (By.CSS_SELECTOR, "button[title*='Download']")
+)
+
+
+@lru_cache(maxsize=8)
+def _get_wait(driver, timeout):
+    """Reuse one WebDriverWait per (driver, timeout) pair."""
+    return WebDriverWait(driver, timeout)
+
+# === LOGGING SETUP ===
+# Records are enqueued and written by a single background listener, so a
+# log call costs an enqueue instead of a file-write+flush that
+# serializes with the downloads. The queue is a multiprocessing.Queue so
+# parse workers reach the same listener (see _init_parse_worker); the
+# listener itself runs only in the main process - a spawned worker
+# re-imports this module but must not open a second FileHandler on
+# LOG_FILE. main() stops the listener in its finally block to flush the
+# queue on exit.
+os.makedirs(OUTPUT_FOLDER, exist_ok=True)
+_log_queue = multiprocessing.Queue()
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+# Message-only on the enqueue side; the listener's handlers add the
+# timestamp/level prefix when they finally write
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
+_log_listener = None
+if multiprocessing.current_process().name == 'MainProcess':
+    _log_listener = logging.handlers.QueueListener(
+        _log_queue,
+        logging.FileHandler(LOG_FILE, encoding='utf-8'),
+        logging.StreamHandler(),
+    )
+    for _handler in _log_listener.handlers:
+        _handler.setFormatter(
+            logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+    _log_listener.start()
+logger = logging.getLogger(__name__)
+
+
+def _init_parse_worker(log_queue):
+    """Point a parse worker's logging at the parent's listener queue.
+
+    Workers must not keep the handler wiring they start with: a forked
+    child inherits a QueueHandler on a queue copy nobody listens to, and
+    a spawned child builds its own dead queue at import. Swapping in a
+    QueueHandler on the shared multiprocessing queue sends worker
+    records through the parent's listener like everything else.
+    """
+    handler = logging.handlers.QueueHandler(log_queue)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    root = logging.getLogger()
+    root.handlers[:] = [handler]
+    root.setLevel(logging.INFO)
+
+# === CHROME DRIVER SETUP ===
+_DRIVER_PATH = None
+
+
+def _driver_path():
+    """Resolve the chromedriver binary once and reuse it for every driver.
+
+    ChromeDriverManager().install() hits the network to check versions, so
+    it runs at most once per process; a CHROMEDRIVER_PATH env var skips
+    webdriver-manager entirely (useful in CI).
+    """
+    global _DRIVER_PATH
+    if _DRIVER_PATH is None:
+        _DRIVER_PATH = os.environ.get("CHROMEDRIVER_PATH") or ChromeDriverManager().install()
+    return _DRIVER_PATH
+
+
+def setup_driver():
+    """Configure Chrome driver with download preferences."""
+    chrome_options = Options()
+    chrome_options.add_argument("--headless=new")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--start-maximized")
+    chrome_options.add_argument("--disable-notifications")
+    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    # Only the causelist table and PDF links matter - skip image decode
+    chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+    
+    temp_dir = tempfile.mkdtemp()
+    chrome_options.add_argument(f"--user-data-dir={temp_dir}")
+    
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_experimental_option('useAutomationExtension', False)
+    
+    prefs = {
+        "download.default_directory": OUTPUT_FOLDER,
+        "download.prompt_for_download": False,
+        "plugins.always_open_pdf_externally": True,
+        "plugins.plugins_disabled": ["Chrome PDF Viewer"],
+        "download.directory_upgrade": True,
+        "safebrowsing.enabled": True,
+        # Block heavy resource types the scraper never looks at
+        "profile.managed_default_content_settings.images": 2,
+        "profile.default_content_setting_values.stylesheet": 2,
+        "profile.managed_default_content_settings.fonts": 2
+    }
+    chrome_options.add_experimental_option("prefs", prefs)
+    
+    driver = webdriver.Chrome(
+        service=Service(_driver_path()),
+        options=chrome_options
+    )
+    return driver
+
+
+# === DOWNLOAD COMPLETION SIGNALING ===
+if WATCHDOG_AVAILABLE:
+    class _PdfDownloadHandler(FileSystemEventHandler):
+        """Signals the waiting thread when a completed PDF lands in the folder."""
+
+        def __init__(self, done_event):
+            self._done = done_event
+
+        def on_created(self, event):
+            if not event.is_directory and event.src_path.lower().endswith('.pdf'):
+                self._done.set()
+
+        def on_moved(self, event):
+            # Chrome renames foo.crdownload -> foo.pdf on completion
+            if not event.is_directory and event.dest_path.lower().endswith('.pdf'):
+                self._done.set()
+
+
+_download_done = threading.Event()
+_download_observer = None
+
+# All drivers share OUTPUT_FOLDER, so browser downloads (snapshot, click,
+# wait, rename) must happen one at a time to attribute files correctly.
+_DOWNLOAD_LOCK = threading.Lock()
+
+
+def _ensure_download_observer():
+    """Start the filesystem observer once; returns False if unavailable."""
+    global _download_observer
+    if not WATCHDOG_AVAILABLE:
+        return False
+    if _download_observer is None:
+        try:
+            _download_observer = Observer()
+            _download_observer.schedule(_PdfDownloadHandler(_download_done), OUTPUT_FOLDER)
+            _download_observer.start()
+        except Exception as e:
+            logging.warning(f"Filesystem observer unavailable, polling instead: {e}")
+            _download_observer = False
+    return bool(_download_observer)
+
+
+def wait_for_download(download_folder, timeout=60):
+    """Wait for download to complete."""
+    if _ensure_download_observer():
+        # Event-driven wait: wake on the .crdownload -> .pdf rename instead
+        # of polling the directory once a second.
+        deadline = time.time() + timeout
+        while True:
+            _download_done.clear()
+            files = os.listdir(download_folder)
+            if not any(f.endswith('.crdownload') or f.endswith('.tmp') for f in files):
+                return True
+            remaining = deadline - time.time()
+            if remaining <= 0 or not _download_done.wait(remaining):
+                logging.warning(f"Download timeout after {timeout} seconds")
+                return False
+
+    # Fallback: poll the directory once a second
+    seconds = 0
+    while seconds < timeout:
+        time.sleep(1)
+        files = os.listdir(download_folder)
+        if not any(f.endswith('.crdownload') or f.endswith('.tmp') for f in files):
+            time.sleep(2)
+            return True
+        seconds += 1
+    logging.warning(f"Download timeout after {timeout} seconds")
+    return False
+
+
+def _pdf_settled(pdf_path, timeout=10):
+    """Wait briefly until pdf_path exists with no in-progress sibling.
+
+    The rename in download_causelist_pdf can surface a beat after it
+    returns (OneDrive-synced folder), so a bare os.path.exists right
+    after the download races and produces false "PDF file not found"
+    errors. A short bounded wait absorbs the gap without a fixed sleep.
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if (os.path.exists(pdf_path)
+                and not os.path.exists(pdf_path + '.crdownload')):
+            return True
+        time.sleep(0.1)
+    return False
+
+
+def get_latest_pdf(folder):
+    """Get the most recently downloaded PDF."""
+    # One scandir pass: the entries carry their stat data, so no extra
+    # per-file getmtime syscalls
+    pdf_files = [e for e in os.scandir(folder) if e.name.lower().endswith('.pdf')]
+    if not pdf_files:
+        return None
+    return max(pdf_files, key=lambda e: e.stat().st_mtime).name
+
+
+def _pdf_snapshot(folder):
+    """Set of PDF filenames currently in the folder."""
+    return {e.name for e in os.scandir(folder) if e.name.lower().endswith('.pdf')}
+
+
+def _newly_downloaded_pdf(folder, before):
+    """Name of the PDF that arrived since the snapshot was taken.
+
+    A set-difference against the pre-download snapshot avoids stat-ing
+    every PDF in the folder on each download; get_latest_pdf remains as
+    the fallback if the diff comes up empty.
+
+    Files already named causelist_* are never candidates: the HTTP
+    fetchers on other date threads write those directly into this
+    folder, while a browser download always lands under the server's
+    own filename before we rename it. Without the filter the diff could
+    claim another thread's PDF and rename it to the wrong date.
+    """
+    new_files = {f for f in _pdf_snapshot(folder) - before
+                 if not f.startswith('causelist_')}
+    if new_files:
+        return next(iter(new_files))
+    latest = get_latest_pdf(folder)
+    if latest and latest.startswith('causelist_'):
+        return None
+    return latest
+
+
+# === DIRECT HTTP FETCH (no browser) ===
+def make_http_session():
+    """Prime a requests session against the causelist page, or None."""
+    if not REQUESTS_AVAILABLE:
+        return None
+    try:
+        session = requests.Session()
+        session.get(CAUSELIST_URL, timeout=30)
+        return session
+    except Exception as e:
+        logging.info(f"HTTP session unavailable ({e}); using browser only")
+        return None
+
+
+async def _fetch_pdf(session, sem, url, dest):
+    """Download one PDF under the shared concurrency limit.
+
+    Rate-limit responses back off exponentially instead of pacing every
+    request with a fixed sleep; well-behaved responses proceed at once.
+    """
+    backoff = 1
+    async with sem:
+        # Probe with HEAD first: one cheap round trip spares the GET and
+        # its whole retry loop for rows whose PDF was never published
+        try:
+            async with session.head(url) as probe:
+                if probe.status in (404, 410):
+                    raise FileNotFoundError(f"no PDF at {url}")
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            pass  # some servers reject or sit on HEAD; let the GET decide
+        for attempt in range(HTTP_RETRIES):
+            async with session.get(url) as resp:
+                if resp.status in (429, 503) and attempt < HTTP_RETRIES - 1:
+                    await asyncio.sleep(min(60, backoff))
+                    backoff *= 2
+                    continue
+                resp.raise_for_status()
+                data = await resp.read()
+            # The endpoint serves captcha/error HTML with HTTP 200; only
+            # a real PDF may land under the canonical filename, or the
+            # row would be skipped as already downloaded forever after
+            if not data.startswith(b'%PDF'):
+                raise ValueError(f"non-PDF body from {url}")
+            Path(dest).write_bytes(data)
+            return
+
+
+async def _fetch_pdfs_async(cookies, jobs):
+    """Fetch (url, dest) jobs concurrently; returns per-job outcomes."""
+    sem = asyncio.Semaphore(HTTP_CONCURRENCY)
+    timeout = aiohttp.ClientTimeout(total=60)
+    async with aiohttp.ClientSession(cookies=cookies, timeout=timeout) as session:
+        return await asyncio.gather(
+            *(_fetch_pdf(session, sem, url, dest) for url, dest in jobs),
+            return_exceptions=True
+        )
+
+
+def _fetch_pdfs_threaded(session, jobs):
+    """Thread-pool fallback when aiohttp isn't installed."""
+    def _fetch_one(job):
+        url, dest = job
+        backoff = 1
+        try:
+            probe = session.head(url, timeout=30)
+            if probe.status_code in (404, 410):
+                raise FileNotFoundError(f"no PDF at {url}")
+        except requests.RequestException:
+            pass  # some servers reject HEAD; let the GET decide
+        for attempt in range(HTTP_RETRIES):
+            r = session.get(url, timeout=60, stream=True)
+            if r.status_code in (429, 503) and attempt < HTTP_RETRIES - 1:
+                time.sleep(min(60, backoff))
+                backoff *= 2
+                continue
+            r.raise_for_status()
+            # Peek at the first chunk before the file is created: the
+            # endpoint serves captcha/error HTML with HTTP 200, and a
+            # non-PDF body must not occupy the canonical filename
+            chunks = r.iter_content(chunk_size=1 << 16)
+            first = next(chunks, b'')
+            if not first.startswith(b'%PDF'):
+                raise ValueError(f"non-PDF body from {url}")
+            with open(dest, 'wb') as f:
+                f.write(first)
+                for chunk in chunks:
+                    f.write(chunk)
+            return
+
+    outcomes = []
+    with ThreadPoolExecutor(max_workers=HTTP_CONCURRENCY) as pool:
+        for future in [pool.submit(_fetch_one, job) for job in jobs]:
+            try:
+                outcomes.append(future.result())
+            except Exception as e:
+                outcomes.append(e)
+    return outcomes
+
+
+def fetch_causelists_via_http(session, date_str):
+    """Fetch one date's causelist PDFs by replaying the site's form POST.
+
+    Drives the ecourts endpoint directly with requests, skipping browser
+    rendering and WebDriver round-trips, and downloads the row PDFs with
+    a small thread pool. Returns (results, new_count, failed) where
+    results is a list of (pdf_filename, bench_name) tuples covering both
+    fresh downloads and files already on disk, new_count is how many
+    were actually fetched this call, and failed lists per-row download
+    errors for the run summary. Returns None when the endpoint doesn't
+    cooperate (captcha, layout change, network error) or nothing came
+    through, so the caller falls back to Selenium.
+    """
+    try:
+        resp = session.post(
+            CAUSELIST_QUERY_URL,
+            data={
+                "state_cd": 6,
+                "dist_cd": 1,
+                "court_code": 1,
+                "stateNm": "Assam",
+                "causelist_dt": date_str,
+            },
+            timeout=30,
+        )
+        resp.raise_for_status()
+    except Exception as e:
+        logging.info(f"HTTP causelist fetch failed ({e}); falling back to browser")
+        return None
+
+    rows = []
+    for tr in RE_HTML_TR.findall(resp.text):
+        cells = RE_HTML_TD.findall(tr)
+        if len(cells) < 3:
+            continue
+        href_match = RE_HREF.search(cells[-1])
+        if not href_match:
+            continue
+        sr_no = RE_HTML_TAG.sub('', cells[0]).strip()
+        bench_name = RE_HTML_TAG.sub('', cells[1]).strip() or "N/A"
+        rows.append((sr_no, bench_name, urljoin(CAUSELIST_URL, href_match.group(1))))
+
+    if not rows:
+        return None
+
+    results = []
+    to_fetch = []
+    for sr_no, bench_name, url in rows:
+        pdf_filename = f"causelist_{date_str}_{sr_no}.pdf"
+        # Membership in the startup snapshot replaces a stat syscall per row
+        if pdf_filename in EXISTING_PDFS:
+            results.append((pdf_filename, bench_name))
+        else:
+            to_fetch.append((sr_no, pdf_filename, bench_name, url,
+                             os.path.join(OUTPUT_FOLDER, pdf_filename)))
+
+    new_count = 0
+    failed = []
+    if to_fetch:
+        if AIOHTTP_AVAILABLE:
+            # All PDFs for the date go out concurrently on one event loop,
+            # bounded by HTTP_CONCURRENCY.
+            outcomes = asyncio.run(_fetch_pdfs_async(
+                session.cookies.get_dict(),
+                [(url, dest) for _, _, _, url, dest in to_fetch]
+            ))
+        else:
+            outcomes = _fetch_pdfs_threaded(
+                session, [(url, dest) for _, _, _, url, dest in to_fetch]
+            )
+        for (sr_no, pdf_filename, bench_name, _, _), outcome in zip(to_fetch, outcomes):
+            if isinstance(outcome, Exception):
+                logging.warning(f"HTTP PDF download failed: {outcome}")
+                failed.append(f"Sr No {sr_no} - {outcome}")
+            else:
+                EXISTING_PDFS.add(pdf_filename)
+                results.append((pdf_filename, bench_name))
+                new_count += 1
+
+    if not results:
+        return None
+    return results, new_count, failed
+
+
+# === DATE PICKER INTERACTION ===
+def select_date_in_picker(driver, date_str):
+    """Select a specific date (already formatted DD-MM-YYYY) in the date picker."""
+    try:
+        wait = _get_wait(driver, 15)
+
+        date_input = None
+        for by_type, selector in DATE_INPUT_SELECTORS:
+            try:
+                date_input = wait.until(EC.element_to_be_clickable((by_type, selector)))
+                logging.info(f"Found date input using: {by_type} = {selector}")
+                break
+            except:
+                continue
+        
+        if not date_input:
+            logging.error("Could not find date input field with any selector")
+            return False
+        
+        date_input.click()
+        date_input.clear()
+
+        driver.execute_script("arguments[0].value = arguments[1];", date_input, date_str)
+        date_input.send_keys(date_str)
+        driver.execute_script("arguments[0].dispatchEvent(new Event('change'));", date_input)
+
+        # Proceed as soon as the field actually holds the date instead of
+        # sleeping a fixed second
+        try:
+            wait.until(lambda d: date_str in d.execute_script(
+                "return arguments[0].value;", date_input))
+        except TimeoutException:
+            logging.warning(f"Date field did not settle on {date_str}")
+
+        logging.info(f"✅ Selected date: {date_str}")
+        return True
+        
+    except Exception as e:
+        logging.error(f"Error selecting date: {e}")
+        try:
+            screenshot_path = os.path.join(OUTPUT_FOLDER, f"error_date_picker_{int(time.time())}.png")
+            driver.save_screenshot(screenshot_path)
+            logging.info(f"Screenshot saved: {screenshot_path}")
+        except:
+            pass
+        return False
+
+
+def click_go_button(driver):
+    """Click the GO button to load cause lists."""
+    try:
+        wait = _get_wait(driver, 10)
+
+        go_button = None
+        for by_type, selector in GO_BUTTON_SELECTORS:
+            try:
+                go_button = wait.until(EC.element_to_be_clickable((by_type, selector)))
+                logging.info(f"Found GO button using: {by_type} = {selector}")
+                break
+            except:
+                continue
+        
+        if not go_button:
+            logging.error("Could not find GO button with any selector")
+            return False
+        
+        go_button.click()
+        logging.info("✅ Clicked GO button")
+
+        # Wait for the results table to appear instead of a fixed delay
+        try:
+            _get_wait(driver, 15).until(
+                EC.presence_of_element_located((By.XPATH, "//table//tr[td]"))
+            )
+        except TimeoutException:
+            # No rows for this date; the table scrape reports it
+            pass
+        return True
+        
+    except Exception as e:
+        logging.error(f"Error clicking GO button: {e}")
+        return False
+
+
+# === CAUSELIST TABLE PROCESSING ===
+def get_causelist_table_rows(driver):
+    """Extract all rows from the causelist table."""
+    try:
+        wait = _get_wait(driver, 10)
+
+        table = wait.until(
+            EC.presence_of_element_located((By.XPATH, CAUSELIST_TABLE_XPATH))
+        )
+
+        # Pull every cell text in one script execution instead of a
+        # WebDriver round-trip per row and per cell, scoped to the table
+        # just located so row indexes can't drift onto another table
+        rows = driver.execute_script(
+            "return Array.from(arguments[0].querySelectorAll('tbody tr'))"
+            ".map(r => Array.from(r.querySelectorAll('td')).map(c => c.innerText.trim()));",
+            table
+        ) or []
+
+        logging.info(f"Found {len(rows)} causelist entries in table")
+
+        # Extract bench names for each row; row_index is the 1-based
+        # position used later to re-locate the View link when clicking.
+        causelist_data = []
+        for idx, cells in enumerate(rows, start=1):
+            if len(cells) >= 3:
+                causelist_data.append({
+                    'sr_no': cells[0],
+                    'bench_name': cells[1] if cells[1] else "N/A",
+                    'causelist_type': cells[2] if cells[2] else "N/A",
+                    'row_index': idx
+                })
+
+        return causelist_data
+        
+    except TimeoutException:
+        logging.warning("No causelist table found for this date")
+        return []
+    except Exception as e:
+        logging.error(f"Error getting table rows: {e}")
+        return []
+
+
+def _fetch_pdf_with_cookies(driver, href, dest_path):
+    """Fetch a directly linked PDF over HTTP with the browser's cookies.
+
+    When the View link exposes a real href there is no need to click
+    through Chrome's tab-and-download flow; a plain GET carrying the
+    driver's session cookies returns the same bytes. Returns True only
+    when a PDF actually landed at dest_path.
+    """
+    if not REQUESTS_AVAILABLE:
+        return False
+    try:
+        session = requests.Session()
+        for cookie in driver.get_cookies():
+            session.cookies.set(cookie['name'], cookie['value'],
+                                domain=cookie.get('domain'))
+        resp = session.get(href, timeout=30)
+        resp.raise_for_status()
+        if not resp.content.startswith(b'%PDF'):
+            return False
+        with open(dest_path, 'wb') as f:
+            f.write(resp.content)
+        return True
+    except Exception as e:
+        logger.debug("Cookie-handoff fetch failed for %s: %s", href, e)
+        return False
+
+
+def download_causelist_pdf(driver, row_data, date_str):
+    """Download PDF for a specific causelist row."""
+    try:
+        sr_no = row_data['sr_no']
+        bench_name = row_data['bench_name']
+        causelist_type = row_data['causelist_type']
+        row_index = row_data['row_index']
+
+        logger.debug("  Sr No %s: Bench - %s, Type - %s",
+                     sr_no, bench_name, causelist_type)
+
+        # Re-locate only the View link for the click; the cell texts were
+        # already captured in the batched table extraction. Both lookups
+        # are anchored to the causelist table row_index was counted in.
+        view_link = None
+        try:
+            table = driver.find_element(By.XPATH, CAUSELIST_TABLE_XPATH)
+        except NoSuchElementException:
+            logging.warning(f"    ⚠️ Causelist table vanished for Sr No {sr_no}")
+            return None, bench_name
+        try:
+            view_link = table.find_element(
+                By.CSS_SELECTOR, f"tbody tr:nth-child({row_index}) a"
+            )
+        except NoSuchElementException:
+            try:
+                view_link = table.find_element(
+                    By.XPATH, f"(.//tr[td])[{row_index}]//a"
+                )
+            except NoSuchElementException:
+                logging.warning(f"    ⚠️ Could not find View link for Sr No {sr_no}")
+                return None, bench_name
+
+        if not view_link:
+            logging.warning(f"    ⚠️ No View link found for Sr No {sr_no}")
+            return None, bench_name
+
+        # Links with a real href skip the tab-and-download flow entirely:
+        # fetch the bytes over HTTP reusing the browser's cookies
+        href = view_link.get_attribute('href')
+        if href and not href.lower().startswith('javascript'):
+            new_name = f"causelist_{date_str}_{sr_no}.pdf"
+            dest_path = os.path.join(OUTPUT_FOLDER, new_name)
+            if _fetch_pdf_with_cookies(driver, href, dest_path):
+                logger.debug("    ✅ Downloaded via HTTP: %s", new_name)
+                return new_name, bench_name
+
+        main_window = driver.current_window_handle
+        before_pdfs = _pdf_snapshot(OUTPUT_FOLDER)
+        view_link.click()
+        time.sleep(3)
+        
+        if len(driver.window_handles) > 1:
+            driver.switch_to.window(driver.window_handles[-1])
+            time.sleep(2)
+            
+            try:
+                download_btn = None
+                for by_type, selector in DOWNLOAD_BUTTON_SELECTORS:
+                    try:
+                        download_btn = _get_wait(driver, 5).until(
+                            EC.element_to_be_clickable((by_type, selector))
+                        )
+                        break
+                    except:
+                        continue
+                
+                if download_btn:
+                    download_btn.click()
+                    logger.debug("    ✅ Clicked download button for Sr No %s", sr_no)
+                else:
+                    logger.debug("    📄 PDF opened (auto-download expected) for Sr No %s", sr_no)
+
+            except TimeoutException:
+                logger.debug("    📄 PDF auto-downloading for Sr No %s", sr_no)
+            
+            if wait_for_download(OUTPUT_FOLDER, timeout=40):
+                latest_pdf = _newly_downloaded_pdf(OUTPUT_FOLDER, before_pdfs)
+                if latest_pdf:
+                    new_name = f"causelist_{date_str}_{sr_no}.pdf"
+                    
+                    old_path = os.path.join(OUTPUT_FOLDER, latest_pdf)
+                    new_path = os.path.join(OUTPUT_FOLDER, new_name)
+                    
+                    if os.path.exists(new_path):
+                        logger.debug("    ⚠️ PDF already exists: %s", new_name)
+                        try:
+                            os.remove(old_path)
+                        except:
+                            pass
+                    else:
+                        try:
+                            os.rename(old_path, new_path)
+                            logger.debug("    ✅ Downloaded: %s", new_name)
+                        except Exception as e:
+                            logging.error(f"    ❌ Error renaming file: {e}")
+                            new_name = latest_pdf
+                    
+                    driver.close()
+                    driver.switch_to.window(main_window)
+                    time.sleep(1)
+                    return new_name, bench_name
+            
+            driver.close()
+            driver.switch_to.window(main_window)
+            time.sleep(1)
+        else:
+            if wait_for_download(OUTPUT_FOLDER, timeout=30):
+                latest_pdf = _newly_downloaded_pdf(OUTPUT_FOLDER, before_pdfs)
+                if latest_pdf:
+                    new_name = f"causelist_{date_str}_{sr_no}.pdf"
+                    
+                    old_path = os.path.join(OUTPUT_FOLDER, latest_pdf)
+                    new_path = os.path.join(OUTPUT_FOLDER, new_name)
+                    
+                    if not os.path.exists(new_path):
+                        os.rename(old_path, new_path)
+                        logging.info(f"    ✅ Downloaded: {new_name}")
+                        return new_name, bench_name
+        
+        return None, bench_name
+        
+    except Exception as e:
+        logging.error(f"    ❌ Error downloading Sr No {sr_no}: {e}")
+        try:
+            if len(driver.window_handles) > 1:
+                driver.close()
+            driver.switch_to.window(driver.window_handles[0])
+        except:
+            pass
+        return None, bench_name
+
+
+# === PDF EXTRACTION FUNCTIONS ===
+def extract_header_info(pdf_text):
+    """Extract court hall number and time from PDF header."""
+    court_no = "N/A"
+    time_info = "N/A"
+    
+    try:
+        # Extract court number
+        court_match = RE_COURT.search(pdf_text)
+        if court_match:
+            court_no = court_match.group(1)
+
+        # Extract time
+        time_match = RE_TIME.search(pdf_text)
+        if time_match:
+            time_info = time_match.group(1)
+
+        # Check for multiple time slots
+        time_match_multi = RE_TIME_MULTI.search(pdf_text)
+        if time_match_multi:
+            time_info = f"{time_match_multi.group(1)} {time_match_multi.group(2)}"
+            
+    except Exception as e:
+        logging.error(f"Error extracting header info: {e}")
+    
+    return court_no, time_info
+
+
+def extract_date_from_filename(filename):
+    """Extract date from filename format: causelist_DD-MM-YYYY_X.pdf"""
+    try:
+        match = RE_DATE_FN.search(filename)
+        if match:
+            return match.group(1)
+        return "N/A"
+    except:
+        return "N/A"
+
+
+# Approximate glyph width used to map an x0 coordinate onto a character
+# column when rebuilding lines from raw chars.
+_CHAR_WIDTH_PT = 6.0
+
+# Causelist PDFs share one column layout, so header positions detected
+# for a given header line are reused for every PDF with the same header.
+_HEADER_CACHE = {}
+
+# Filenames already present in OUTPUT_FOLDER, loaded once at startup so a
+# resumed run skips the browser flow for rows it already downloaded.
+EXISTING_PDFS = set()
+
+# Content digests of PDFs whose parse completed in this or a previous
+# run, loaded from STATE_DB at startup. Keyed by bytes rather than name
+# so a re-download under a fresh name is still recognised.
+PARSED_HASHES = set()
+
+
+def _pdf_digest(pdf_path):
+    """SHA1 of the PDF bytes; file_digest streams and uses SHA-NI where present."""
+    with open(pdf_path, 'rb') as f:
+        return hashlib.file_digest(f, 'sha1').hexdigest()
+
+
+def load_parsed_index(db_path):
+    """Open the cross-run parse index and prime PARSED_HASHES from it.
+
+    Membership checks run in downloader threads against the in-memory
+    set; only main() writes through the returned connection, so the
+    sqlite handle never crosses threads.
+    """
+    conn = sqlite3.connect(db_path)
+    conn.execute('CREATE TABLE IF NOT EXISTS done(hash TEXT PRIMARY KEY)')
+    PARSED_HASHES.update(h for (h,) in conn.execute('SELECT hash FROM done'))
+    return conn
+
+
+def record_parsed(conn, digest):
+    """Mark one PDF's content as parsed, durably and in PARSED_HASHES."""
+    conn.execute('INSERT OR IGNORE INTO done(hash) VALUES (?)', (digest,))
+    conn.commit()
+    PARSED_HASHES.add(digest)
+
+
+def _page_text_from_chars(page):
+    """Rebuild a page's text lines directly from pdfplumber's char list.
+
+    Buckets chars into rows by their top coordinate and orders each row
+    by x0, padding with spaces proportional to the horizontal position so
+    the column-based parsing downstream sees the same shape as layout
+    text - without running pdfplumber's full layout engine.
+    """
+    rows = defaultdict(list)
+    for ch in page.chars:
+        rows[round(ch['top'])].append(ch)
+
+    lines = []
+    for top in sorted(rows):
+        row_chars = sorted(rows[top], key=lambda c: c['x0'])
+        pieces = []
+        col = 0
+        for ch in row_chars:
+            target = int(ch['x0'] / _CHAR_WIDTH_PT)
+            if target > col:
+                pieces.append(' ' * (target - col))
+                col = target
+            pieces.append(ch['text'])
+            col += len(ch['text'])
+        lines.append(''.join(pieces))
+    return '\n'.join(lines)
+
+
+def _extract_pdf_text(pdf_path):
+    """Extract layout-preserving text from every page of the PDF.
+
+    Prefers PyMuPDF, then pypdfium2 - both native extractors several
+    times faster than pdfplumber's pure-Python layout engine. The final
+    fallback is pdfplumber, rebuilding lines straight from the char list
+    instead of paying for extract_text(layout=True).
+    """
+    if PYMUPDF_AVAILABLE:
+        doc = fitz.open(pdf_path)
+        try:
+            return "\n".join(page.get_text("text") for page in doc)
+        finally:
+            doc.close()
+
+    if PYPDFIUM_AVAILABLE:
+        pdf = pdfium.PdfDocument(pdf_path)
+        try:
+            return "\n".join(page.get_textpage().get_text_bounded() for page in pdf)
+        finally:
+            pdf.close()
+
+    all_text = ""
+    with pdfplumber.open(pdf_path) as pdf:
+        for page in pdf.pages:
+            page_text = _page_text_from_chars(page)
+            if page_text:
+                all_text += page_text + "\n"
+    return all_text
+
+
+def parse_gauhati_causelist(pdf_path, bench_name_from_table):
+    """Parse Gauhati High Court causelist PDF using positional text parsing.
+
+    Returns a list of tuples in HEADERS[1:] order, ready for the writers.
+    Raises on any extraction failure rather than returning partial or
+    empty results, so the drain loop never records a failed PDF in the
+    fingerprint index - a truncated download stays retryable.
+    """
+    cases = []
+    
+    try:
+        pdf_filename = os.path.basename(pdf_path)
+        logging.info(f"\n{'='*60}")
+        logging.info(f"📄 Extracting: {pdf_filename}")
+        logging.info(f"{'='*60}")
+        
+        # Extract date from filename
+        cause_date = extract_date_from_filename(pdf_filename)
+        
+        # Extract layout-preserving text (pypdfium2 when available,
+        # pdfplumber otherwise)
+        all_text = _extract_pdf_text(pdf_path)
+
+        if not all_text:
+            raise ValueError(f"No text extracted from {pdf_filename}")
+        
+        # Extract header information
+        court_no, time_info = extract_header_info(all_text)
+        bench_name = bench_name_from_table if bench_name_from_table != "N/A" else "N/A"
+        
+        logger.debug("Court No: %s, Time: %s, Bench: %s, Date: %s",
+                     court_no, time_info, bench_name, cause_date)
+        
+        # Split text into lines
+        lines = all_text.split('\n')
+        
+        # Find the header line with column positions
+        header_idx = -1
+        header_positions = {}
+        
+        for i, line in enumerate(lines):
+            if 'Sr.No' in line and 'Case Number' in line and 'Main Parties' in line:
+                header_idx = i
+                logger.debug("Found header at line %s", i)
+
+                # Find column positions, reusing the cached result when
+                # this exact header line has been seen before
+                cached = _HEADER_CACHE.get(line)
+                if cached is not None:
+                    header_positions = cached
+                else:
+                    if 'Sr.No' in line:
+                        header_positions['sr_no'] = line.find('Sr.No')
+                    if 'Case Number' in line:
+                        header_positions['case_number'] = line.find('Case Number')
+                    if 'Main Parties' in line:
+                        header_positions['main_parties'] = line.find('Main Parties')
+                    if 'Petitioner Advocate' in line:
+                        header_positions['pet_advocate'] = line.find('Petitioner Advocate')
+                    if 'Respondent Advocate' in line:
+                        header_positions['resp_advocate'] = line.find('Respondent Advocate')
+                    _HEADER_CACHE[line] = header_positions
+
+                logger.debug("Column positions: %s", header_positions)
+                break
+        
+        if header_idx == -1:
+            raise ValueError(f"No header found in {pdf_filename}")
+        
+        # Start parsing from the line after header and separator
+        i = header_idx + 1
+        
+        # Skip separator lines (dashes)
+        while i < len(lines) and '---' in lines[i]:
+            i += 1
+        
+        logger.debug("Starting case extraction from line %s", i)
+        
+        # Parse cases
+        case_count = 0
+        while i < len(lines):
+            line = lines[i]
+            
+            # Check if line starts with a number (Sr.No) at the beginning
+            # Cheap digit check before invoking the regex - most lines are
+            # not case rows, so this skips the matcher for the majority.
+            stripped = line.lstrip()
+            sr_match = RE_SRNO.match(stripped) if stripped[:1].isdigit() else None
+            
+            if sr_match:
+                case_count += 1
+                sr_no = sr_match.group(1)
+                
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("--- Case %s: Sr.No %s ---", case_count, sr_no)
+                    logger.debug("Line %s: %s", i, line[:100])
+                
+                # Collect all lines for this case until next Sr.No or section break
+                case_lines = [line]
+                j = i + 1
+                
+                while j < len(lines):
+                    next_line = lines[j]
+                    next_stripped = next_line.lstrip()
+                    
+                    # Stop if we hit next case number
+                    if next_stripped[:1].isdigit() and RE_SRNO.match(next_stripped):
+                        break
+                    
+                    # Stop if we hit a major section break
+                    if '===' in next_line or 'LEAVE NOTE' in next_line:
+                        break
+                    
+                    # Skip pure separator lines
+                    if next_line.strip() and not next_line.strip().replace('-', '').strip():
+                        j += 1
+                        continue
+                    
+                    if next_line.strip():
+                        case_lines.append(next_line)
+                    
+                    j += 1
+                
+                # Extract case number - take the first line that matches.
+                # Case tokens always contain '/', so the substring test
+                # (a vectorized scan in CPython) skips most lines before
+                # the backtracking regex ever runs.
+                case_match = None
+                for case_line in case_lines:
+                    if '/' not in case_line:
+                        continue
+                    case_match = RE_CASE.search(case_line)
+                    if case_match:
+                        break
+
+                case_type = "N/A"
+                case_number = "N/A"
+                case_year = "N/A"
+
+                if case_match:
+                    case_type = case_match.group(1)
+                    case_number = case_match.group(2)
+                    case_year = case_match.group(3)
+                    logger.debug("Case: %s/%s/%s", case_type, case_number, case_year)
+                else:
+                    # Alternative pattern for complex types
+                    for case_line in case_lines:
+                        if '/' not in case_line:
+                            continue
+                        alt_match = RE_CASE_ALT.search(case_line)
+                        if alt_match:
+                            case_match = alt_match
+                            case_type = alt_match.group(1)
+                            case_number = alt_match.group(2)
+                            case_year = alt_match.group(3)
+                            logger.debug("Case (alt): %s/%s/%s", case_type, case_number, case_year)
+                            break
+
+                # Extract parties by splitting on "Versus" - work on the
+                # line list directly rather than joining into one string
+                # and re-splitting it.
+                petitioner = "N/A"
+                respondent = "N/A"
+                petitioner_advocate = "N/A"
+                respondent_advocate = "N/A"
+
+                case_token = case_match.group(0) if case_match else None
+                versus_idx = next(
+                    (k for k, l in enumerate(case_lines) if 'Versus' in l), -1
+                )
+
+                if versus_idx >= 0:
+                    # Split the Versus line in place
+                    head, _, tail = case_lines[versus_idx].partition('Versus')
+                    pre_lines = case_lines[:versus_idx] + [head]
+                    post_lines = [tail] + case_lines[versus_idx + 1:]
+
+                    # Extract petitioner - remove sr no and case number
+                    pet_lines = []
+                    for k, pet_line in enumerate(pre_lines):
+                        if k == 0:
+                            pet_line = RE_STRIP_SRNO.sub('', pet_line.lstrip())
+                        if case_token:
+                            pet_line = pet_line.replace(case_token, '')
+                        pet_line = pet_line.strip()
+                        # Filter out any WITH or other keywords
+                        if pet_line and not pet_line.startswith('WITH') and not pet_line.startswith('in '):
+                            pet_lines.append(pet_line)
+                    petitioner = ' '.join(pet_lines).strip()
+
+                    # Process the lines after Versus
+                    after_lines = [l.strip() for l in post_lines if l.strip()]
+                    
+                    # Separate respondent from advocates
+                    resp_lines = []
+                    pet_adv_lines = []
+                    resp_adv_lines = []
+                    
+                    found_advocate = False
+                    
+                    for line_text in after_lines:
+                        # Check if this line contains advocate keywords
+                        has_advocate = bool(RE_ADVOCATE.search(line_text))
+
+                        if not found_advocate and not has_advocate:
+                            # This is respondent
+                            resp_lines.append(line_text)
+                        elif has_advocate:
+                            found_advocate = True
+                            # This is advocate line
+                            # Respondent advocates have (R- or (r- pattern
+                            if RE_R_MARKER.search(line_text):
+                                resp_adv_lines.append(line_text)
+                            else:
+                                # Petitioner advocate (no R- marker)
+                                pet_adv_lines.append(line_text)
+                    
+                    respondent = ' '.join(resp_lines).strip() if resp_lines else "N/A"
+                    petitioner_advocate = ' '.join(pet_adv_lines).strip() if pet_adv_lines else "N/A"
+                    respondent_advocate = ' '.join(resp_adv_lines).strip() if resp_adv_lines else "N/A"
+                    
+                else:
+                    # No Versus found - might be a WITH clause or other format
+                    pet_lines = []
+                    for k, pet_line in enumerate(case_lines):
+                        if k == 0:
+                            pet_line = RE_STRIP_SRNO.sub('', pet_line.lstrip())
+                        if case_token:
+                            pet_line = pet_line.replace(case_token, '')
+                        pet_line = pet_line.strip()
+                        if pet_line:
+                            pet_lines.append(pet_line)
+                    petitioner = ' '.join(pet_lines).strip()
+                
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Petitioner: %s", petitioner[:70])
+                    logger.debug("Respondent: %s", respondent[:70])
+                    logger.debug("Pet Advocate: %s", petitioner_advocate[:70])
+                    logger.debug("Resp Advocate: %s", respondent_advocate[:70])
+                
+                # Create case entry: a positional tuple in HEADERS[1:]
+                # order, so the writers append it as-is with no per-cell
+                # dict lookups (the id column is assigned at flush time)
+                cases.append((
+                    sr_no,                 # causelist_slno
+                    court_no,              # court_hall_number
+                    case_number,           # Case_number
+                    case_type,             # Case_type
+                    case_year,             # case_year
+                    bench_name,            # bench_name
+                    cause_date,            # cause_date
+                    time_info,             # time
+                    petitioner,            # petitioner
+                    respondent,            # respondent
+                    petitioner_advocate,   # petitioner_advocate
+                    respondent_advocate,   # respondent_advocate
+                    "List Downloaded",     # particulars
+                    pdf_filename,          # Pdf_name
+                    "N/A",                 # case_status
+                ))
+                
+                # Move to next case
+                i = j
+            else:
+                i += 1
+        
+        logging.info(f"\n{'='*60}")
+        logging.info(f"✅ Extracted {len(cases)} cases from {pdf_filename}")
+        logging.info(f"{'='*60}\n")
+        
+    except Exception as e:
+        # Log here for the traceback, then propagate so future.result()
+        # raises in the drain loop and the digest is never recorded
+        logging.error(f"❌ Error processing {pdf_path}: {e}", exc_info=True)
+        raise
+
+    return cases
+
+
+# Fixed xlsx package parts for the direct XML writer below. Only the
+# worksheet itself varies between runs.
+_XLSX_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '</Types>'
+)
+_XLSX_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+_XLSX_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="Cases" sheetId="1" r:id="rId1"/></sheets></workbook>'
+)
+_XLSX_WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>'
+    '</Relationships>'
+)
+
+
+def write_xlsx_fast(rows, headers, path):
+    """Write rows straight to xlsx by emitting the sheet XML ourselves.
+
+    Bypasses openpyxl's per-cell object and style machinery: every cell
+    is an inline string, so the cost per row is one f-string plus zip
+    deflate. No shared-strings or styles tables are produced.
+    """
+    def _sheet_xml():
+        yield '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        yield ('<worksheet xmlns="http://schemas.openxmlformats.org/'
+               'spreadsheetml/2006/main"><sheetData>')
+        yield from _row_xml(headers)
+        for row in rows:
+            yield from _row_xml(row)
+        yield '</sheetData></worksheet>'
+
+    def _row_xml(row):
+        yield '<row>'
+        for value in row:
+            yield f'<c t="inlineStr"><is><t>{escape(str(value))}</t></is></c>'
+        yield '</row>'
+
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr('[Content_Types].xml', _XLSX_CONTENT_TYPES)
+        zf.writestr('_rels/.rels', _XLSX_RELS)
+        zf.writestr('xl/workbook.xml', _XLSX_WORKBOOK)
+        zf.writestr('xl/_rels/workbook.xml.rels', _XLSX_WORKBOOK_RELS)
+        # Stream the sheet through deflate in ~1 MB chunks so memory
+        # stays flat however many rows land, instead of joining the
+        # whole sheet XML into one string first
+        with zf.open('xl/worksheets/sheet1.xml', 'w') as sheet:
+            buf = []
+            buffered = 0
+            for fragment in _sheet_xml():
+                buf.append(fragment)
+                buffered += len(fragment)
+                if buffered >= 1 << 20:
+                    sheet.write(''.join(buf).encode('utf-8'))
+                    buf = []
+                    buffered = 0
+            if buf:
+                sheet.write(''.join(buf).encode('utf-8'))
+
+
+def open_cases_csv(csv_path):
+    """Open the streaming CSV store, returning (file, writer, next_id).
+
+    CSV is the durable incremental format: appending a batch costs one
+    formatted line per row, where appending to the xlsx means loading
+    and rewriting the whole workbook. The header goes in only when the
+    file is new, and ids continue from any rows left by a previous run.
+    """
+    existing_rows = 0
+    if os.path.exists(csv_path) and os.path.getsize(csv_path) > 0:
+        with open(csv_path, newline='', encoding='utf-8') as f:
+            existing_rows = sum(1 for _ in csv.reader(f))
+    csv_f = open(csv_path, 'a', newline='', encoding='utf-8',
+                 buffering=1 << 20)
+    writer = csv.writer(csv_f)
+    if existing_rows == 0:
+        writer.writerow(HEADERS)
+        existing_rows = 1
+    return csv_f, writer, existing_rows  # header occupies row 1
+
+
+def flush_cases_to_csv(writer, cases_data, next_id):
+    """Append a batch of parsed cases to the CSV; returns the next id.
+
+    Cases arrive as positional tuples already in HEADERS[1:] order, so
+    each row is one tuple concatenation - no per-cell dict lookups.
+    """
+    writer.writerows(
+        (next_id + i,) + case for i, case in enumerate(cases_data)
+    )
+    return next_id + len(cases_data)
+
+
+def csv_to_xlsx(csv_path, xlsx_path):
+    """Convert the streamed CSV into the final xlsx in a single pass."""
+    with open(csv_path, newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        headers = next(reader)
+        write_xlsx_fast(reader, headers, xlsx_path)
+
+
+# === MAIN EXECUTION ===
+def submit_parse(executor, parse_futures, pdf_path, bench_name):
+    """Queue one PDF for parsing unless its bytes were parsed before.
+
+    The digest rides along with the future so main() can record it in
+    the cross-run index once the parse actually succeeds. Returns True
+    when a parse was queued.
+    """
+    digest = _pdf_digest(pdf_path)
+    if digest in PARSED_HASHES:
+        logger.debug("Already parsed in a previous run: %s", pdf_path)
+        return False
+    parse_futures.append(
+        (executor.submit(parse_gauhati_causelist, pdf_path, bench_name),
+         digest))
+    return True
+
+
+def process_date(driver_pool, http_session, executor, parse_futures, current_date, date_str):
+    """Download all causelist PDFs for one date.
+
+    Tries the HTTP fast path first, then borrows a driver from the pool
+    for the Selenium flow. Completed PDFs are submitted to the parse
+    executor immediately so extraction overlaps the remaining downloads;
+    the futures land in parse_futures for main() to drain. date_str is
+    the DD-MM-YYYY form, computed once in main(). Returns
+    (pdf_count, failures) so main() can aggregate totals across dates.
+    """
+    failures = []
+
+    logging.info("\n" + "=" * 80)
+    logging.info(f"PROCESSING DATE: {date_str}")
+    logging.info("=" * 80)
+
+    # Fast path: replay the form POST over HTTP and skip the browser
+    # entirely; fall back to Selenium when it fails.
+    if http_session is not None:
+        http_fetch = fetch_causelists_via_http(http_session, date_str)
+        if http_fetch:
+            http_results, new_count, http_failed = http_fetch
+            for pdf_filename, bench_name in http_results:
+                submit_parse(executor, parse_futures,
+                             os.path.join(OUTPUT_FOLDER, pdf_filename),
+                             bench_name)
+            failures.extend(f"{date_str} - {f}" for f in http_failed)
+            logging.info("Date %s via HTTP: %s downloaded, %s reused, %s failed",
+                         date_str, new_count,
+                         len(http_results) - new_count, len(http_failed))
+            return new_count, failures
+
+    driver = driver_pool.get()
+    try:
+        # driver.get blocks until the page load completes; the date-input
+        # wait in select_date_in_picker covers any late scripts
+        driver.get(CAUSELIST_URL)
+
+        if not select_date_in_picker(driver, date_str):
+            logging.error(f"Failed to select date: {current_date}")
+            failures.append(f"{date_str} - Date selection failed")
+            return 0, failures
+
+        if not click_go_button(driver):
+            logging.error("Failed to click GO button")
+            failures.append(f"{date_str} - GO button click failed")
+            return 0, failures
+
+        # Get causelist rows with bench names
+        causelist_data = get_causelist_table_rows(driver)
+
+        if not causelist_data:
+            logging.warning(f"No cause lists found for {date_str}")
+            return 0, failures
+
+        # Process each row. Per-row outcomes are buffered and logged as
+        # one Counter summary at the date boundary; with several dates in
+        # flight, a formatted+flushed info line per sr_no adds up.
+        date_pdfs = 0
+        events = []
+        name_prefix = f"causelist_{date_str}_"  # bound once per date
+        for row_data in causelist_data:
+            sr_no = row_data['sr_no']
+            bench_name = row_data['bench_name']
+
+            target_name = f"{name_prefix}{sr_no}.pdf"
+            if target_name in EXISTING_PDFS:
+                # Already on disk: skip the browser, but still offer it
+                # to the parse pipeline - the fingerprint index makes
+                # this a no-op unless a previous run downloaded the file
+                # and died before its parse was recorded
+                if submit_parse(executor, parse_futures,
+                                os.path.join(OUTPUT_FOLDER, target_name),
+                                bench_name):
+                    events.append('reparsed')
+                else:
+                    events.append('skipped')
+                continue
+
+            with _DOWNLOAD_LOCK:
+                pdf_filename, bench = download_causelist_pdf(driver, row_data, date_str)
+
+            if pdf_filename:
+                date_pdfs += 1
+
+                # Hand the PDF to the parse pipeline; extraction runs on
+                # the process pool while the next download proceeds.
+                pdf_path = os.path.join(OUTPUT_FOLDER, pdf_filename)
+                if _pdf_settled(pdf_path):
+                    EXISTING_PDFS.add(pdf_filename)
+                    if submit_parse(executor, parse_futures, pdf_path,
+                                    bench_name):
+                        events.append('downloaded')
+                    else:
+                        events.append('already-parsed')
+                else:
+                    logging.error(f"❌ PDF file not found: {pdf_path}")
+                    events.append('missing')
+            else:
+                failures.append(f"{date_str} - Sr No {sr_no}")
+                events.append('failed')
+
+        logging.info("Date %s: %s", date_str,
+                     dict(Counter(events)) or 'no rows')
+        return date_pdfs, failures
+
+    finally:
+        driver_pool.put(driver)
+
+
+def main():
+    logging.info("=" * 80)
+    logging.info("GAUHATI HIGH COURT CAUSELIST PDF DOWNLOADER & EXTRACTOR")
+    logging.info("=" * 80)
+
+    total_pdfs_downloaded = 0
+    total_cases_extracted = 0
+    failed_downloads = []
+
+    # Parse pipeline: downloader threads submit each completed PDF
+    # straight to the process pool, so extraction overlaps the remaining
+    # downloads and the futures are drained once at the end.
+    executor = ProcessPoolExecutor(
+        max_workers=os.cpu_count(),
+        initializer=_init_parse_worker,
+        initargs=(_log_queue,),
+    )
+    parse_futures = []
+
+    http_session = make_http_session()
+
+    state_db = load_parsed_index(STATE_DB)
+
+    EXISTING_PDFS.update(
+        e.name for e in os.scandir(OUTPUT_FOLDER)
+        if e.name.startswith('causelist_') and e.name.endswith('.pdf')
+    )
+
+    # Materialize the dates once, formatting each DD-MM-YYYY string a
+    # single time instead of on every use downstream
+    date_range = [START_DATE + timedelta(days=i)
+                  for i in range((END_DATE - START_DATE).days + 1)]
+    date_strs = [d.strftime('%d-%m-%Y') for d in date_range]
+
+    # Dates are independent, so spread them over a small pool of drivers.
+    # Each task borrows a driver from the queue, guaranteeing one user at
+    # a time per driver.
+    driver_count = min(MAX_DRIVERS, len(date_range)) or 1
+    drivers = [setup_driver() for _ in range(driver_count)]
+    driver_pool = queue.Queue()
+    for d in drivers:
+        driver_pool.put(d)
+
+    try:
+        with ThreadPoolExecutor(max_workers=driver_count) as date_pool:
+            futures = [
+                date_pool.submit(process_date, driver_pool, http_session,
+                                 executor, parse_futures, d, ds)
+                for d, ds in zip(date_range, date_strs)
+            ]
+            for future, ds in zip(futures, date_strs):
+                try:
+                    date_pdfs, failures = future.result()
+                    total_pdfs_downloaded += date_pdfs
+                    failed_downloads.extend(failures)
+                except Exception as e:
+                    logging.error(f"Date {ds} failed: {e}", exc_info=True)
+                    failed_downloads.append(f"{ds} - {e}")
+
+        # Drain the parse results, streaming rows to the CSV in large
+        # batches; the xlsx is generated from it exactly once at the end
+        # instead of being rewritten per flush
+        csv_f, csv_writer, next_id = open_cases_csv(CSV_FILE)
+        pending = []
+        # Completion order, not submission order: the buffer keeps
+        # filling past a slow straggler, so each writerows call runs
+        # over rows that were produced moments ago
+        future_digests = dict(parse_futures)
+        try:
+            for future in as_completed(future_digests):
+                try:
+                    pending.extend(future.result())
+                    record_parsed(state_db, future_digests[future])
+                except Exception as e:
+                    logging.error(f"Parse worker failed: {e}")
+                if len(pending) >= FLUSH_ROWS:
+                    next_id = flush_cases_to_csv(csv_writer, pending, next_id)
+                    total_cases_extracted += len(pending)
+                    pending = []
+            if pending:
+                flush_cases_to_csv(csv_writer, pending, next_id)
+                total_cases_extracted += len(pending)
+        finally:
+            csv_f.close()
+        executor.shutdown()
+
+        if os.path.getsize(CSV_FILE) > 0:
+            csv_to_xlsx(CSV_FILE, EXCEL_FILE)
+            logging.info(f"✅ Saved {total_cases_extracted} cases to Excel")
+        if total_cases_extracted == 0:
+            logging.warning("⚠️ No cases extracted from any PDF")
+
+        # Final summary
+        logging.info("\n" + "=" * 80)
+        logging.info("PDF DOWNLOAD & EXTRACTION COMPLETED")
+        logging.info("=" * 80)
+        logging.info(f"Total PDFs Downloaded: {total_pdfs_downloaded}")
+        logging.info(f"Total Cases Extracted: {total_cases_extracted}")
+        logging.info(f"Failed Downloads: {len(failed_downloads)}")
+        
+        if failed_downloads:
+            logging.info("\nFailed Download Details:")
+            for fail in failed_downloads:
+                logging.info(f"  ❌ {fail}")
+        
+        logging.info(f"\nPDFs saved to: {OUTPUT_FOLDER}")
+        logging.info(f"Excel file saved to: {EXCEL_FILE}")
+        logging.info(f"Log file saved to: {LOG_FILE}")
+        
+    except Exception as e:
+        logging.error(f"Critical error in main execution: {e}", exc_info=True)
+        
+    finally:
+        state_db.close()
+        for d in drivers:
+            d.quit()
+        logging.info("\nBrowsers closed. Process finished.")
+        _log_listener.stop()
+
+
+if __name__ == "__main__":
     main()
\ No newline at end of file